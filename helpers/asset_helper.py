@@ -13,14 +13,23 @@ def is_superhive_asset(asset: AssetRepresentation) -> bool:
     return bool(asset.metadata.sh_uuid)
 
 
-def convert_to_superhive_asset(context: Context, asset: AssetRepresentation, name: str = "", description: str = "", tags: list[str] = None) -> None:
+def convert_to_superhive_asset(
+    context: Context,
+    asset: AssetRepresentation,
+    name: str = "",
+    description: str = "",
+    tags: list[str] = None,
+    *,
+    prefs: 'sh_prefs.SH_AddonPreferences' = None,
+) -> None:
     if is_superhive_asset(asset):
         return
     asset.metadata.sh_uuid = str(uuid.uuid4())
     # asset.metadata.sh_name = name or asset.name
     asset.metadata.sh_description = description or asset.name
     # asset.metadata.sh_tags.from_dict(tags or [])
-    prefs: 'sh_prefs.SH_AddonPreferences' = context.preferences.addons[base_package].preferences
+    if prefs is None:
+        prefs = context.preferences.addons[base_package].preferences
     asset.metadata.sh_author = prefs.default_auther_name or asset.metadata.author
     try:
         asset.metadata.sh_license = prefs.default_license or asset.metadata.license
@@ -30,15 +39,16 @@ def convert_to_superhive_asset(context: Context, asset: AssetRepresentation, nam
 
 
 def to_dict(asset: AssetRepresentation) -> dict[str, Any]:
+    metadata = asset.metadata
     return {
-        "uuid": asset.metadata.sh_uuid,
-        "name": asset.metadata.sh_name,
-        "description": asset.metadata.sh_description,
-        "tags": asset.metadata.sh_tags.to_dict(),
-        "category": asset.metadata.sh_category,
-        "author": asset.metadata.sh_author,
-        "license": asset.metadata.sh_license,
-        "created_blender_version": asset.metadata.sh_created_blender_version,
+        "uuid": metadata.sh_uuid,
+        "name": metadata.sh_name,
+        "description": metadata.sh_description,
+        "tags": metadata.sh_tags.to_dict(),
+        "category": metadata.sh_category,
+        "author": metadata.sh_author,
+        "license": metadata.sh_license,
+        "created_blender_version": metadata.sh_created_blender_version,
     }
 
 
@@ -46,34 +56,35 @@ def from_dict(asset: AssetRepresentation, data: dict[str, Any]):
     if not data:
         return
 
-    asset.metadata.sh_uuid = data.get(
+    metadata = asset.metadata
+    metadata.sh_uuid = data.get(
         "uuid",
-        asset.metadata.sh_uuid
+        metadata.sh_uuid
     )
-    asset.metadata.sh_name = data.get(
+    metadata.sh_name = data.get(
         "name",
-        asset.metadata.sh_name
+        metadata.sh_name
     )
-    asset.metadata.sh_description = data.get(
+    metadata.sh_description = data.get(
         "description",
-        asset.metadata.sh_description
+        metadata.sh_description
     )
-    asset.metadata.sh_tags.from_dict(
+    metadata.sh_tags.from_dict(
         data.get("tags", {})
     )
-    asset.metadata.sh_category = data.get(
+    metadata.sh_category = data.get(
         "category",
-        asset.metadata.sh_category
+        metadata.sh_category
     )
-    asset.metadata.sh_author = data.get(
+    metadata.sh_author = data.get(
         "author",
-        asset.metadata.sh_author
+        metadata.sh_author
     )
-    asset.metadata.sh_license = data.get(
+    metadata.sh_license = data.get(
         "license",
-        asset.metadata.sh_license
+        metadata.sh_license
     )
-    asset.metadata.sh_created_blender_version = data.get(
+    metadata.sh_created_blender_version = data.get(
         "created_blender_version",
-        asset.metadata.sh_created_blender_version
+        metadata.sh_created_blender_version
     )
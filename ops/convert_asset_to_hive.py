@@ -3,6 +3,7 @@ from bpy.types import Operator
 from bpy_extras import asset_utils
 
 from ..helpers import asset_helper
+from .. import __package__ as base_package
 
 
 class SH_OT_ConvertAssetsToHive(Operator):
@@ -13,26 +14,24 @@ class SH_OT_ConvertAssetsToHive(Operator):
 
     @classmethod
     def poll(cls, context):
-        is_asset_browser = asset_utils.SpaceAssetInfo.is_asset_browser(context.space_data)
-        if is_asset_browser and context.selected_assets:
-            return True
-        
-        if not is_asset_browser:
+        if not asset_utils.SpaceAssetInfo.is_asset_browser(context.space_data):
             cls.poll_message_set("Context must be in the asset browser")
-        elif not context.selected_assets:
+            return False
+
+        if not context.selected_assets:
             cls.poll_message_set(
                 "Please select an asset to convert to a hive asset")
+            return False
 
-        return False
+        return True
 
     def execute(self, context):
         assets = context.selected_assets
+        prefs = context.preferences.addons[base_package].preferences
 
         for asset in assets:
-            if asset_helper.is_superhive_asset(asset):
-                continue
             asset_helper.convert_to_superhive_asset(
-                context, asset
+                context, asset, prefs=prefs
             )
 
         return {'FINISHED'}
@@ -44,10 +43,12 @@ classes = (
 
 
 def register():
+    register_class = bpy.utils.register_class
     for cls in classes:
-        bpy.utils.register_class(cls)
+        register_class(cls)
 
 
 def unregister():
+    unregister_class = bpy.utils.unregister_class
     for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+        unregister_class(cls)
@@ -119,10 +119,12 @@ classes = (
 
 
 def register():
+    register_class = bpy.utils.register_class
     for cls in classes:
-        bpy.utils.register_class(cls)
+        register_class(cls)
 
 
 def unregister():
+    unregister_class = bpy.utils.unregister_class
     for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+        unregister_class(cls)
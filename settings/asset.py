@@ -22,8 +22,9 @@ classes = (
 
 
 def register():
+    register_class = bpy.utils.register_class
     for cls in classes:
-        bpy.utils.register_class(cls)
+        register_class(cls)
 
     AssetMetaData.sh_uuid = StringProperty(
         name="UUID",
@@ -77,5 +78,6 @@ def unregister():
     del AssetMetaData.sh_license
     del AssetMetaData.sh_created_blender_version
 
+    unregister_class = bpy.utils.unregister_class
     for cls in classes:
-        bpy.utils.unregister_class(cls)
+        unregister_class(cls)
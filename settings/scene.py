@@ -23,12 +23,14 @@ classes = (
 
 
 def register():
+    register_class = bpy.utils.register_class
     for cls in classes:
-        bpy.utils.register_class(cls)
+        register_class(cls)
     bpy.types.Scene.superhive = PointerProperty(type=SH_Scene)
 
 
 def unregister():
     del bpy.types.Scene.superhive
+    unregister_class = bpy.utils.unregister_class
     for cls in classes:
-        bpy.utils.unregister_class(cls)
+        unregister_class(cls)
@@ -34,8 +34,6 @@ class SH_PT_AssetSettings(asset_utils.AssetMetaDataPanel, Panel):
     def draw(self, context):
         layout: UILayout = self.layout
 
-        prefs: 'sh_prefs.SH_AddonPreferences' = context.preferences.addons[base_package].preferences
-
         if not context.selected_assets:
             row = layout.row()
             row.alignment = "CENTER"
@@ -43,21 +41,22 @@ class SH_PT_AssetSettings(asset_utils.AssetMetaDataPanel, Panel):
             return
 
         asset: AssetRepresentation = context.asset
+        metadata = asset.metadata
 
-        if asset.metadata.sh_uuid == "":
+        if metadata.sh_uuid == "":
             layout.operator("superhive.convert_assets_to_hive")
             return
         
         layout.prop(asset, "name")
-        layout.prop(asset.metadata, "sh_description")
-        layout.prop(asset.metadata, "author")
-        layout.prop(asset.metadata, "sh_license")
-        layout.prop(asset.metadata, "sh_created_blender_version")
-        
+        layout.prop(metadata, "sh_description")
+        layout.prop(metadata, "author")
+        layout.prop(metadata, "sh_license")
+        layout.prop(metadata, "sh_created_blender_version")
 
+        prefs: 'sh_prefs.SH_AddonPreferences' = context.preferences.addons[base_package].preferences
         if prefs.display_extras:
             layout.label(text="Extra information is displayed")
-            layout.label(text=f"UUID: {asset.metadata.sh_uuid}")
+            layout.label(text=f"UUID: {metadata.sh_uuid}")
 
 
 classes = (
@@ -66,8 +65,9 @@ classes = (
 
 
 def register():
+    register_class = bpy.utils.register_class
     for cls in classes:
-        bpy.utils.register_class(cls)
+        register_class(cls)
     bpy.types.FILEBROWSER_HT_header.append(draw_assetbrowser_header)
     # bpy.types.ASSETBROWSER_PT_metadata.append(draw_assetbrowser_metadata)
 
@@ -75,5 +75,6 @@ def register():
 def unregister():
     bpy.types.FILEBROWSER_HT_header.remove(draw_assetbrowser_header)
     # bpy.types.ASSETBROWSER_PT_metadata.remove(draw_assetbrowser_metadata)
+    unregister_class = bpy.utils.unregister_class
     for cls in classes:
-        bpy.utils.unregister_class(cls)
\ No newline at end of file
+        unregister_class(cls)
\ No newline at end of file
@@ -2,6 +2,7 @@ import bpy
 from bpy.types import AddonPreferences
 from bpy.props import StringProperty, EnumProperty
 from .. import __package__ as base_package
+from .. import hive_mind
 import os
 
 
@@ -22,15 +23,7 @@ class SH_AddonPreferences(AddonPreferences):
     default_license: EnumProperty(
         name="Default License",
         description="The default license to use for new assets",
-        items=(
-            ("CC0", "CC0", "CC0"),
-            ("CC-BY", "CC-BY", "CC-BY"),
-            ("CC-BY-SA", "CC-BY-SA", "CC-BY-SA"),
-            ("CC-BY-NC", "CC-BY-NC", "CC-BY-NC"),
-            ("CC-BY-ND", "CC-BY-ND", "CC-BY-ND"),
-            ("CC-BY-NC-SA", "CC-BY-NC-SA", "CC-BY-NC-SA"),
-            ("CC-BY-NC-ND", "CC-BY-NC-ND", "CC-BY-NC-ND"),
-        ),
+        items=hive_mind.get_licenses(),
         default="CC0",
     )
 
@@ -55,10 +48,12 @@ classes = (
 
 
 def register():
+    register_class = bpy.utils.register_class
     for cls in classes:
-        bpy.utils.register_class(cls)
+        register_class(cls)
 
 
 def unregister():
+    unregister_class = bpy.utils.unregister_class
     for cls in classes:
-        bpy.utils.unregister_class(cls)
\ No newline at end of file
+        unregister_class(cls)
\ No newline at end of file